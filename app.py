@@ -1,71 +1,194 @@
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import matplotlib.pyplot as plt
 import yfinance as yf
-from scipy.optimize import minimize
+from scipy.optimize import minimize, OptimizeResult
+from scipy.linalg import cholesky, cho_factor, cho_solve
+from numba import njit
 
 # Funções auxiliares
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_data(tickers, start_date, end_date):
-    return yf.download(tickers, start=start_date, end=end_date)['Adj Close']
+    # Cache em disco dos preços, reaproveitado entre reinicializações do processo por até um dia
+    key = hashlib.md5(f"{tickers}{start_date}{end_date}".encode()).hexdigest()
+    path = Path(tempfile.gettempdir()) / f"px_{key}.parquet"
+    if path.exists() and time.time() - path.stat().st_mtime < 86400:
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ValueError, pa.ArrowInvalid):
+            # Arquivo corrompido ou ilegível: descarta e baixa novamente
+            path.unlink(missing_ok=True)
+    data = yf.download(list(tickers), start=start_date, end=end_date, threads=True,
+                       progress=False, auto_adjust=False, group_by='column')['Adj Close']
+    # O yfinance não lança exceção em falhas (retorna vazio ou colunas só com NaN); exceções não ficam em cache
+    if data.empty or not data.notna().any().all():
+        raise RuntimeError(f"Incomplete price download for {list(tickers)}")
+    # Gravação atômica e sem interromper o app em caso de falha
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        data.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    return data
 
 def calculate_returns(prices):
-    return prices.pct_change().dropna()
+    # Descarta as datas iniciais em que algum ativo ainda não tem preço (ativo listado depois do início)
+    complete = prices.notna().all(axis=1)
+    if not complete.any():
+        raise ValueError(f"No date with prices for all tickers: {list(prices.columns)}")
+    prices = prices.loc[complete.idxmax():]
+    returns = prices.ffill().pct_change(fill_method=None).iloc[1:]
+    return returns.index, returns.to_numpy(dtype=np.float64, copy=False)
+
+def ledoit_wolf(X, mu_vec, cov):
+    n, p = X.shape
+    X2 = (X - mu_vec) ** 2
+    emp_cov = cov * (n - 1) / n
+    target = np.trace(emp_cov) / p
+    # Intensidade de encolhimento de Ledoit-Wolf em direção a um múltiplo da identidade
+    delta = np.sum((emp_cov - target * np.eye(p)) ** 2) / p
+    beta = (np.sum(X2.T @ X2) / n - np.sum(emp_cov ** 2)) / (p * n)
+    shrinkage = min(beta, delta) / delta if delta > 0 else 0.0
+    return (1 - shrinkage) * cov + shrinkage * (np.trace(cov) / p) * np.eye(p)
 
-def portfolio_performance(weights, returns):
-    portfolio_return = np.sum(returns.mean() * weights) * 252
-    portfolio_std = np.sqrt(np.dot(weights.T, np.dot(returns.cov() * 252, weights)))
+def annualized_statistics(X):
+    n = X.shape[0]
+    mu_vec = X.mean(0)
+    cov = (X.T @ X) / (n - 1) - (n / (n - 1)) * np.outer(mu_vec, mu_vec)
+    cov = ledoit_wolf(X, mu_vec, cov)
+    # Ordem Fortran evita cópias internas nas chamadas LAPACK (Cholesky)
+    return mu_vec * 252, np.asfortranarray(cov * 252)
+
+def portfolio_performance(weights, mean_returns, cov_matrix, cov_cholesky=None):
+    portfolio_return = mean_returns @ weights
+    if cov_cholesky is not None:
+        y = cov_cholesky.T @ weights
+        portfolio_std = np.sqrt(y @ y)
+    else:
+        portfolio_std = np.sqrt(weights @ cov_matrix @ weights)
     return portfolio_return, portfolio_std
 
-def negative_sharpe_ratio(weights, returns, risk_free_rate=0.01):
-    p_return, p_std = portfolio_performance(weights, returns)
-    return -(p_return - risk_free_rate) / p_std
+@njit(cache=True, fastmath=True)
+def neg_sharpe_and_grad(w, mu, S, rf):
+    Sw = S @ w
+    r = mu @ w
+    s = np.sqrt(w @ Sw)
+    val = -(r - rf) / s
+    grad = -(mu * s - (r - rf) * Sw / s) / (s * s)
+    return val, grad
+
+def tangency_portfolio(mu, S, risk_free_rate=0.01, cov_cholesky=None):
+    if cov_cholesky is None:
+        cov_cholesky = cholesky(S, lower=True)
+    excess = mu - risk_free_rate
+    active = np.ones(len(mu), dtype=bool)
+    # Refinamento por conjunto ativo: remove o ativo de peso mais negativo e resolve de novo
+    while active.any():
+        w = np.zeros(len(mu))
+        if active.all():
+            w[:] = cho_solve((cov_cholesky, True), excess)
+        else:
+            w[active] = cho_solve(cho_factor(S[np.ix_(active, active)], lower=True), excess[active])
+        if w.sum() <= 0:
+            return None
+        if np.all(w >= 0):
+            break
+        active[np.argmin(w)] = False
+    else:
+        return None
+    w /= w.sum()
+    # Condição KKT: nenhum ativo zerado pode melhorar o Sharpe ao receber peso
+    Sw = S @ w
+    gap = excess - Sw * (excess @ w) / (w @ Sw)
+    if np.any(gap[~active] > 1e-10):
+        return None
+    return w
+
+def max_sharpe_ratio(mu, S, risk_free_rate=0.01, use_slsqp=False, cov_cholesky=None):
+    num_assets = len(mu)
+    mu = np.ascontiguousarray(mu, dtype=np.float64)
+    S = np.asfortranarray(S, dtype=np.float64)
+    risk_free_rate = float(risk_free_rate)
 
-def max_sharpe_ratio(returns):
-    num_assets = returns.shape[1]
-    args = (returns,)
-    constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1})
+    if not use_slsqp:
+        weights = tangency_portfolio(mu, S, risk_free_rate, cov_cholesky)
+        if weights is not None:
+            fun = -(mu @ weights - risk_free_rate) / np.sqrt(weights @ S @ weights)
+            return OptimizeResult(x=weights, fun=fun, success=True, status=0,
+                                  message='Closed-form tangency portfolio')
+
+    def neg_sharpe(w):
+        return neg_sharpe_and_grad(w, mu, S, risk_free_rate)[0]
+
+    def neg_sharpe_jac(w):
+        return neg_sharpe_and_grad(w, mu, S, risk_free_rate)[1]
+
+    constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: np.ones_like(x)})
     bounds = tuple((0, 1) for _ in range(num_assets))
-    result = minimize(negative_sharpe_ratio, num_assets * [1. / num_assets], args=args,
+    result = minimize(neg_sharpe, num_assets * [1. / num_assets], jac=neg_sharpe_jac,
                       method='SLSQP', bounds=bounds, constraints=constraints)
     return result
 
-def calculate_var(returns, confidence_level=0.05):
-    return returns.quantile(confidence_level, axis=0)  # Retorna uma série de quantis para cada ativo
+def solve_portfolio(returns, risk_free_rate=0.01):
+    mean_returns, cov_matrix = annualized_statistics(returns)
+    # Fatoração de Cholesky da covariância, reutilizada nas resoluções e no cálculo da volatilidade
+    cov_cholesky = cholesky(cov_matrix, lower=True)
+    optimal_weights = max_sharpe_ratio(mean_returns, cov_matrix, risk_free_rate, cov_cholesky=cov_cholesky).x
+    opt_return, opt_std = portfolio_performance(optimal_weights, mean_returns, cov_matrix, cov_cholesky)
+    return optimal_weights, opt_return, opt_std
 
-# Coleta de dados históricos de preços
-tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
-data = get_data(tickers, '2020-01-01', '2023-01-01')
-
-# Cálculo dos retornos diários
-returns = calculate_returns(data)
+@st.cache_data(show_spinner=False)
+def sharpe_sensitivity(opt_return, opt_std):
+    rf_grid = np.linspace(0, 0.05, 51)  # 0% a 5% em passos de 0,1%, como no slider
+    return rf_grid, (opt_return - rf_grid) / opt_std
 
-# Análise de desempenho
-mean_returns = returns.mean() * 252
-cov_matrix = returns.cov() * 252
-risk_free_rate = 0.01
+@st.cache_resource(ttl=3600, show_spinner=False)
+def compute_all(tickers, start_date, end_date, risk_free_rate=0.01):
+    # Coleta de dados históricos de preços e cálculo dos retornos diários
+    data = get_data(tickers, start_date, end_date)
+    dates, returns = calculate_returns(data)
 
-# Otimização da carteira
-optimal_portfolio = max_sharpe_ratio(returns)
-optimal_weights = optimal_portfolio.x
+    # Otimização da carteira e desempenho da carteira otimizada
+    optimal_weights, opt_return, opt_std = solve_portfolio(returns, risk_free_rate)
 
-# Cálculo do desempenho da carteira otimizada
-opt_return, opt_std = portfolio_performance(optimal_weights, returns)
-opt_sharpe = (opt_return - risk_free_rate) / opt_std
+    # Cálculo do VaR e do desempenho cumulativo da carteira otimizada
+    portfolio_returns = returns @ optimal_weights
+    VaR_95 = np.quantile(portfolio_returns, 0.05)
+    cumulative_returns = np.exp(np.cumsum(np.log1p(portfolio_returns)))
 
-# Cálculo do VaR
-VaR_95 = calculate_var(returns, 0.05)
+    # Os arrays em cache são compartilhados entre sessões; somente leitura evita alterações acidentais
+    optimal_weights.setflags(write=False)
+    cumulative_returns.setflags(write=False)
+    return dict(weights=optimal_weights, ret=opt_return, std=opt_std,
+                sharpe=(opt_return - risk_free_rate) / opt_std, var=VaR_95,
+                cum=cumulative_returns, dates=dates)
 
-# Definição da aplicação Streamlit
-st.title('Investimentos Bancários - Dashboard Estatístico')
+# Ativos e período analisados
+tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+start_date, end_date = '2020-01-01', '2023-01-01'
+risk_free_rate = 0.01
 
-# Lista de Ativos Avaliados
-st.subheader('Ativos Avaliados')
-st.write(", ".join(tickers))
+# Cálculos da carteira, em cache por até uma hora (mesmo prazo do download)
+results = compute_all(tuple(tickers), start_date, end_date, risk_free_rate)
+optimal_weights, opt_return, opt_std = results['weights'], results['ret'], results['std']
+opt_sharpe, VaR_95 = results['sharpe'], results['var']
 
-# Objetivo
-with st.expander("Explicação do Dashboard Estatístico de Investimentos Bancários"):
-    st.write("""
+# Textos da interface por idioma
+STRINGS = {
+    "pt": {
+        "title": 'Investimentos Bancários - Dashboard Estatístico',
+        "assets_header": 'Ativos Avaliados',
+        "intro_expander": "Explicação do Dashboard Estatístico de Investimentos Bancários",
+        "intro_text": """
 Este dashboard foi desenvolvido para ajudar na análise e na otimização de investimentos em um conjunto de ativos financeiros populares, como Apple (AAPL), Microsoft (MSFT), Google (GOOGL), Amazon (AMZN) e Tesla (TSLA).
 
 **Objetivos:**
@@ -87,80 +210,194 @@ Este dashboard foi desenvolvido para ajudar na análise e na otimização de inv
 **Conclusões:**
 - **Resultados Positivos:** Indicam um bom desempenho da carteira, com retornos superiores ao esperado e um Sharpe Ratio positivo. 📈
 - **Resultados Negativos:** Sugerem que a carteira pode não estar otimizada para o risco assumido, com retornos abaixo das expectativas ou um Sharpe Ratio inferior. 📉
-""")
+""",
+        "cum_header": 'Gráfico de Desempenho Cumulativo',
+        "cum_expander": "Análise do Gráfico de Desempenho Cumulativo",
+        "cum_text": """
+    O gráfico de desempenho cumulativo mostra como o investimento evolui ao longo do tempo. Observamos uma tendência geral de crescimento, refletindo o retorno acumulado da carteira otimizada. É importante notar que períodos de alta volatilidade podem estar associados a maior variabilidade nos retornos diários, o que impacta diretamente a trajetória de crescimento a longo prazo.
+    """,
+        "cum_positive": ":chart_with_upwards_trend: **Avaliação:** O resultado é positivo, pois mostra um crescimento consistente do investimento ao longo do período analisado, apesar das flutuações de curto prazo.",
+        "cum_negative": ":chart_with_downwards_trend: **Avaliação:** O resultado é negativo, indicando um possível declínio no investimento ao longo do período analisado.",
+        "metrics_header": 'Resumo de Métricas de Desempenho',
+        "metric_return": 'Retorno Anual Esperado',
+        "metric_volatility": 'Volatilidade Anual',
+        "metrics_expander": "Análise das Métricas de Desempenho",
+        "metrics_text": """
+    As métricas apresentadas são fundamentais para avaliar o desempenho e o risco da carteira. O **Retorno Anual Esperado** reflete a média ponderada dos retornos esperados para os ativos selecionados. A **Volatilidade Anual** indica o grau de flutuação dos retornos, sendo um indicativo de risco. O **Sharpe Ratio** ajusta o retorno da carteira pelo seu risco, considerando a taxa livre de risco. O **VaR 95%** fornece uma medida de risco de perda, indicando o pior resultado esperado com 95% de confiança.
+    """,
+        "metrics_positive": ":white_check_mark: **Avaliação:** Os resultados são positivos. O Retorno Anual Esperado e o Sharpe Ratio estão acima das expectativas, indicando uma carteira bem otimizada em relação ao risco assumido.",
+        "metrics_negative": ":x: **Avaliação:** Os resultados são negativos. O Retorno Anual Esperado e/ou o Sharpe Ratio estão abaixo das expectativas, indicando que a carteira pode não estar otimizada em relação ao risco assumido.",
+        "weights_header": 'Distribuição de Retornos e Risco',
+        "weights_expander": "Análise da Distribuição de Retornos e Risco",
+        "weights_text": """
+    A distribuição de pesos mostra como a alocação de ativos está distribuída dentro da carteira otimizada. Observamos que alguns ativos podem ter uma participação mais significativa, refletindo suas contribuições esperadas para o retorno da carteira.
+    """,
+        "weights_negative": ":warning: **Avaliação:** A distribuição pode não ser ideal devido à alocação negativa em alguns ativos.",
+        "weights_positive": ":white_check_mark: **Avaliação:** A distribuição parece equilibrada, com uma diversificação adequada entre os ativos selecionados.",
+        "sensitivity_header": 'Análise de Sensibilidade',
+        "rf_slider": 'Taxa Livre de Risco (%)',
+        "rf_selected": "Taxa Livre de Risco selecionada: {}%",
+        "sensitivity_chart_caption": "Sharpe Ratio da carteira otimizada (eixo vertical) em função da taxa livre de risco, em % (eixo horizontal).",
+        "sensitivity_expander": "Análise da Sensibilidade à Taxa Livre de Risco",
+        "sensitivity_text": """
+    A taxa livre de risco é um fator crítico no cálculo do Sharpe Ratio, afetando a relação entre retorno e risco da carteira.
+    """,
+        "sensitivity_positive": ":white_check_mark: **Avaliação:** Ajustar a taxa livre de risco permite uma avaliação mais precisa do risco ajustado ao retorno da carteira, sendo essencial em diferentes cenários econômicos.",
+        "sensitivity_negative": ":x: **Avaliação:** Ajustar a taxa livre de risco pode não estar contribuindo para uma melhora significativa no Sharpe Ratio da carteira.",
+        "notes_header": 'Notas Explicativas e Metodológicas',
+        "notes_text": """
+Neste dashboard, utilizamos uma metodologia baseada na otimização de portfólios para calcular métricas de desempenho e risco. Os preços históricos dos ativos foram obtidos através do Yahoo Finance e os retornos diários foram calculados a partir desses preços. A otimização da carteira foi realizada utilizando o método de minimização para maximizar o índice de Sharpe, considerando o trade-off entre risco e retorno.
+
+As suposições feitas incluem a distribuição normal ou próxima a ela dos retornos dos ativos e a eficiência dos preços de mercado ao refletir informações passadas e presentes. É importante destacar que resultados passados não garantem retornos futuros, e a análise deve ser continuamente revisada e ajustada conforme novas informações se tornem disponíveis.
+
+**Avaliação Geral:** O uso dessas técnicas proporcionou resultados positivos, refletidos nas métricas de desempenho e no crescimento consistente da carteira otimizada ao longo do período analisado.
+""",
+    },
+    "en": {
+        "title": 'Banking Investments - Statistical Dashboard',
+        "assets_header": 'Evaluated Assets',
+        "intro_expander": "Explanation of the Banking Investments Statistical Dashboard",
+        "intro_text": """
+This dashboard was developed to assist in the analysis and optimization of investments in a set of popular financial assets such as Apple (AAPL), Microsoft (MSFT), Google (GOOGL), Amazon (AMZN), and Tesla (TSLA).
+
+**Objectives:**
+- **Performance Analysis:** Evaluate how these assets have performed over time in terms of return and risk.
+- **Portfolio Optimization:** Determine the optimal allocation of each asset to maximize risk-adjusted return.
+- **Sensitivity Analysis:** Understand how different scenarios, such as changes in the risk-free rate, affect portfolio performance.
+
+**Indicators Used:**
+1. **Expected Annual Return:** Weighted average of expected annual returns for the selected assets.
+2. **Annual Volatility:** Indicates the degree of fluctuation in returns over time, reflecting risk.
+3. **Sharpe Ratio:** Measures risk-adjusted return, considering the risk-free rate as a benchmark.
+4. **VaR 95% (Value at Risk):** Estimates the worst expected loss with 95% confidence, providing a measure of risk.
+
+**Questions Answered:**
+- **What was the performance of the portfolio over time?** The cumulative performance chart shows how the investment evolved.
+- **How is risk and return distributed among different assets?** The distribution of returns and risk provides insights into optimal asset allocation.
+- **How does portfolio performance vary with different levels of risk-free rate?** Sensitivity analysis helps understand the impact of changes in the risk-free rate on the portfolio.
+
+**Conclusions:**
+- **Positive Results:** Indicate good portfolio performance with returns higher than expected and a positive Sharpe Ratio. 📈
+- **Negative Results:** Suggest the portfolio may not be optimized for the assumed risk, with returns below expectations or a lower Sharpe Ratio. 📉
+""",
+        "cum_header": 'Cumulative Performance Chart',
+        "cum_expander": "Analysis of Cumulative Performance Chart",
+        "cum_text": """
+    The cumulative performance chart shows how the investment has evolved over time. We observe an overall growth trend, reflecting the cumulative return of the optimized portfolio. It's important to note that periods of high volatility may be associated with greater variability in daily returns, which directly impacts long-term growth trajectory.
+    """,
+        "cum_positive": ":chart_with_upwards_trend: **Evaluation:** The result is positive, showing consistent investment growth over the analyzed period, despite short-term fluctuations.",
+        "cum_negative": ":chart_with_downwards_trend: **Evaluation:** The result is negative, indicating a possible decline in investment over the analyzed period.",
+        "metrics_header": 'Summary of Performance Metrics',
+        "metric_return": 'Expected Annual Return',
+        "metric_volatility": 'Annual Volatility',
+        "metrics_expander": "Analysis of Performance Metrics",
+        "metrics_text": """
+    The presented metrics are essential for evaluating portfolio performance and risk. **Expected Annual Return** reflects the weighted average of expected returns for the selected assets. **Annual Volatility** indicates the degree of fluctuation in returns, serving as a risk indicator. **Sharpe Ratio** adjusts portfolio return for its risk, considering the risk-free rate. **VaR 95%** provides a measure of loss risk, indicating the worst expected outcome with 95% confidence.
+    """,
+        "metrics_positive": ":white_check_mark: **Evaluation:** The results are positive. Expected Annual Return and Sharpe Ratio are above expectations, indicating a well-optimized portfolio relative to assumed risk.",
+        "metrics_negative": ":x: **Evaluation:** The results are negative. Expected Annual Return and/or Sharpe Ratio are below expectations, suggesting the portfolio may not be optimized relative to assumed risk.",
+        "weights_header": 'Distribution of Returns and Risk',
+        "weights_expander": "Analysis of Distribution of Returns and Risk",
+        "weights_text": """
+    The weight distribution shows how asset allocation is distributed within the optimized portfolio. We observe that some assets may have a more significant share, reflecting their expected contributions to portfolio return.
+    """,
+        "weights_negative": ":warning: **Evaluation:** The distribution may not be ideal due to negative allocation in some assets.",
+        "weights_positive": ":white_check_mark: **Evaluation:** The distribution appears balanced, with adequate diversification among selected assets.",
+        "sensitivity_header": 'Sensitivity Analysis',
+        "rf_slider": 'Risk-Free Rate (%)',
+        "rf_selected": "Selected Risk-Free Rate: {}%",
+        "sensitivity_chart_caption": "Sharpe Ratio of the optimized portfolio (vertical axis) as a function of the risk-free rate, in % (horizontal axis).",
+        "sensitivity_expander": "Analysis of Sensitivity to Risk-Free Rate",
+        "sensitivity_text": """
+    The risk-free rate is a critical factor in Sharpe Ratio calculation, affecting the relationship between portfolio return and risk.
+    """,
+        "sensitivity_positive": ":white_check_mark: **Evaluation:** Adjusting the risk-free rate allows for a more accurate assessment of risk-adjusted return, crucial in different economic scenarios.",
+        "sensitivity_negative": ":x: **Evaluation:** Adjusting the risk-free rate may not be contributing significantly to improving the portfolio's Sharpe Ratio.",
+        "notes_header": 'Explanatory and Methodological Notes',
+        "notes_text": """
+In this dashboard, we used a portfolio optimization-based methodology to calculate performance and risk metrics. Historical asset prices were obtained from Yahoo Finance, and daily returns were calculated based on these prices. Portfolio optimization was performed using the minimization method to maximize the Sharpe Ratio, considering the trade-off between risk and return.
+
+Assumptions include the normal distribution or close to it of asset returns and market efficiency in reflecting past and present information. It is important to note that past results do not guarantee future returns, and analysis should be continuously reviewed and adjusted as new information becomes available.
+
+**Overall Assessment:** The use of these techniques provided positive results, reflected in performance metrics and consistent growth of the optimized portfolio over the analyzed period.
+""",
+    },
+}
+
+# Definição da aplicação Streamlit
+lang = st.sidebar.selectbox("Idioma/Language", ["pt", "en"])
+S = STRINGS[lang]
+st.title(S['title'])
+
+# Lista de Ativos Avaliados
+st.subheader(S['assets_header'])
+st.write(", ".join(tickers))
+
+# Objetivo
+with st.expander(S['intro_expander']):
+    st.write(S['intro_text'])
     
 # Gráfico de Desempenho Cumulativo
-st.subheader('Gráfico de Desempenho Cumulativo')
-portfolio_returns = returns.dot(optimal_weights)
-cumulative_returns = (1 + portfolio_returns).cumprod()
-st.line_chart(cumulative_returns)
+st.subheader(S['cum_header'])
+st.line_chart(pd.Series(results['cum'], index=results['dates']))
 
 # Análise do Gráfico de Desempenho Cumulativo
-with st.expander("Análise do Gráfico de Desempenho Cumulativo"):
-    st.write("""
-    O gráfico de desempenho cumulativo mostra como o investimento evolui ao longo do tempo. Observamos uma tendência geral de crescimento, refletindo o retorno acumulado da carteira otimizada. É importante notar que períodos de alta volatilidade podem estar associados a maior variabilidade nos retornos diários, o que impacta diretamente a trajetória de crescimento a longo prazo.
-    """)
-    if portfolio_returns.iloc[-1] > 1:
-        st.write(":chart_with_upwards_trend: **Avaliação:** O resultado é positivo, pois mostra um crescimento consistente do investimento ao longo do período analisado, apesar das flutuações de curto prazo.")
+with st.expander(S['cum_expander']):
+    st.write(S['cum_text'])
+    if results['cum'][-1] > 1:
+        st.write(S['cum_positive'])
     else:
-        st.write(":chart_with_downwards_trend: **Avaliação:** O resultado é negativo, indicando um possível declínio no investimento ao longo do período analisado.")
+        st.write(S['cum_negative'])
 
 # Métricas de Desempenho em Cards
-st.subheader('Resumo de Métricas de Desempenho')
+st.subheader(S['metrics_header'])
 col1, col2, col3, col4 = st.columns(4)
-col1.metric(label='Retorno Anual Esperado', value=f'{opt_return:.2%}')
-col2.metric(label='Volatilidade Anual', value=f'{opt_std:.2%}')
+col1.metric(label=S['metric_return'], value=f'{opt_return:.2%}')
+col2.metric(label=S['metric_volatility'], value=f'{opt_std:.2%}')
 col3.metric(label='Sharpe Ratio', value=f'{opt_sharpe:.2f}')
-col4.metric(label='VaR 95%', value=f'{VaR_95.mean():.2%}')  # Corrigido para exibir um único valor de VaR
+col4.metric(label='VaR 95%', value=f'{VaR_95:.2%}')
 
 # Análise das Métricas de Desempenho
-with st.expander("Análise das Métricas de Desempenho"):
-    st.write("""
-    As métricas apresentadas são fundamentais para avaliar o desempenho e o risco da carteira. O **Retorno Anual Esperado** reflete a média ponderada dos retornos esperados para os ativos selecionados. A **Volatilidade Anual** indica o grau de flutuação dos retornos, sendo um indicativo de risco. O **Sharpe Ratio** ajusta o retorno da carteira pelo seu risco, considerando a taxa livre de risco. O **VaR 95%** fornece uma medida de risco de perda, indicando o pior resultado esperado com 95% de confiança.
-    """)
+with st.expander(S['metrics_expander']):
+    st.write(S['metrics_text'])
     if opt_return > 0 and opt_sharpe > 0:
-        st.write(":white_check_mark: **Avaliação:** Os resultados são positivos. O Retorno Anual Esperado e o Sharpe Ratio estão acima das expectativas, indicando uma carteira bem otimizada em relação ao risco assumido.")
+        st.write(S['metrics_positive'])
     elif opt_return < 0 or opt_sharpe < 0:
-        st.write(":x: **Avaliação:** Os resultados são negativos. O Retorno Anual Esperado e/ou o Sharpe Ratio estão abaixo das expectativas, indicando que a carteira pode não estar otimizada em relação ao risco assumido.")
+        st.write(S['metrics_negative'])
 
 # Distribuição de Retornos e Risco
-st.subheader('Distribuição de Retornos e Risco')
+st.subheader(S['weights_header'])
 st.bar_chart(optimal_weights)
 
 # Análise da Distribuição de Retornos e Risco
-with st.expander("Análise da Distribuição de Retornos e Risco"):
-    st.write("""
-    A distribuição de pesos mostra como a alocação de ativos está distribuída dentro da carteira otimizada. Observamos que alguns ativos podem ter uma participação mais significativa, refletindo suas contribuições esperadas para o retorno da carteira.
-    """)
+with st.expander(S['weights_expander']):
+    st.write(S['weights_text'])
     if np.any(optimal_weights < 0):
-        st.write(":warning: **Avaliação:** A distribuição pode não ser ideal devido à alocação negativa em alguns ativos.")
+        st.write(S['weights_negative'])
     else:
-        st.write(":white_check_mark: **Avaliação:** A distribuição parece equilibrada, com uma diversificação adequada entre os ativos selecionados.")
+        st.write(S['weights_positive'])
 
 # Análise de Sensibilidade
-st.subheader('Análise de Sensibilidade')
-risk_free_rate_slider = st.slider('Taxa Livre de Risco (%)', min_value=0.0, max_value=5.0, value=1.0, step=0.1)
-st.write(f"Taxa Livre de Risco selecionada: {risk_free_rate_slider}%")
+st.subheader(S['sensitivity_header'])
+risk_free_rate_slider = st.slider(S['rf_slider'], min_value=0.0, max_value=5.0, value=1.0, step=0.1)
+st.write(S['rf_selected'].format(risk_free_rate_slider))
+
+# Sharpe Ratio da carteira otimizada para a taxa livre de risco selecionada
+rf_grid, sharpe_grid = sharpe_sensitivity(opt_return, opt_std)
+opt_sharpe_adjusted = sharpe_grid[int(round(risk_free_rate_slider / 0.1))]
 
-# Recálculo do desempenho da carteira otimizada com a nova taxa livre de risco
-opt_sharpe_adjusted = (opt_return - risk_free_rate_slider / 100) / opt_std
+# Sharpe Ratio da carteira otimizada em toda a faixa de taxas livres de risco
+st.line_chart(pd.Series(sharpe_grid, index=rf_grid * 100))
+st.caption(S['sensitivity_chart_caption'])
 
 # Análise da Sensibilidade à Taxa Livre de Risco
-with st.expander("Análise da Sensibilidade à Taxa Livre de Risco"):
-    st.write("""
-    A taxa livre de risco é um fator crítico no cálculo do Sharpe Ratio, afetando a relação entre retorno e risco da carteira.
-    """)
+with st.expander(S['sensitivity_expander']):
+    st.write(S['sensitivity_text'])
     if opt_sharpe_adjusted > 0:
-        st.write(":white_check_mark: **Avaliação:** Ajustar a taxa livre de risco permite uma avaliação mais precisa do risco ajustado ao retorno da carteira, sendo essencial em diferentes cenários econômicos.")
+        st.write(S['sensitivity_positive'])
     else:
-        st.write(":x: **Avaliação:** Ajustar a taxa livre de risco pode não estar contribuindo para uma melhora significativa no Sharpe Ratio da carteira.")
+        st.write(S['sensitivity_negative'])
 
 # Notas Explicativas e Metodológicas
-st.subheader('Notas Explicativas e Metodológicas')
-st.write("""
-Neste dashboard, utilizamos uma metodologia baseada na otimização de portfólios para calcular métricas de desempenho e risco. Os preços históricos dos ativos foram obtidos através do Yahoo Finance e os retornos diários foram calculados a partir desses preços. A otimização da carteira foi realizada utilizando o método de minimização para maximizar o índice de Sharpe, considerando o trade-off entre risco e retorno.
-
-As suposições feitas incluem a distribuição normal ou próxima a ela dos retornos dos ativos e a eficiência dos preços de mercado ao refletir informações passadas e presentes. É importante destacar que resultados passados não garantem retornos futuros, e a análise deve ser continuamente revisada e ajustada conforme novas informações se tornem disponíveis.
-
-**Avaliação Geral:** O uso dessas técnicas proporcionou resultados positivos, refletidos nas métricas de desempenho e no crescimento consistente da carteira otimizada ao longo do período analisado.
-""")
+st.subheader(S['notes_header'])
+st.write(S['notes_text'])